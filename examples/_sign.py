@@ -0,0 +1,13 @@
+"""Shared sign for the examples, so running several of them in one process only
+starts the matrix driver once."""
+from opensign import OpenSign
+
+_SIGN = None
+
+
+def get_sign(**kwargs):
+    """Create the sign on first use and return the same one after that."""
+    global _SIGN  # pylint: disable=global-statement
+    if _SIGN is None:
+        _SIGN = OpenSign(**kwargs)
+    return _SIGN
@@ -1,6 +1,5 @@
 #!/usr/bin/env python
-import time
-from opensign import OpenSign
+from _sign import get_sign
 from opensign.canvas import OpenSignCanvas
 
 
@@ -11,6 +10,12 @@ def main():
     message1.add_text("Scroll Text In", color=(255, 0, 0))
     message1.set_shadow()
 
+    # Render the other texts for message1 once instead of on every pass
+    change_message = message1.clone_style()
+    change_message.add_text("Change Messages")
+    scroll_out_message = message1.clone_style()
+    scroll_out_message.add_text("And Scroll Out")
+
     message2 = OpenSignCanvas()
     message2.add_font(
         "comic", "/usr/share/fonts/truetype/msttcorefonts/Comic_Sans_MS.ttf", 14
@@ -31,36 +36,32 @@ def main():
     message4.add_text("Subscribe to my Channel", color=(255, 255, 255))
     message4.set_shadow()
 
-    sign = OpenSign(chain=6)
+    sign = get_sign(chain=6)
     sign.set_background_image("background.jpg")
 
     while True:
         sign.scroll_in_from_left(message1)
-        time.sleep(1)
-        message1.clear()
-        message1.add_text("Change Messages")
-        sign.show(message1)
-        time.sleep(1)
-        message1.clear()
-        message1.add_text("And Scroll Out")
-        sign.show(message1)
-        sign.scroll_out_to_right(message1)
-        time.sleep(1)
+        sign.dwell(1)
+        sign.show(change_message)
+        sign.dwell(1)
+        sign.show(scroll_out_message)
+        sign.scroll_out_to_right(scroll_out_message)
+        sign.dwell(1)
 
-        sign.join_in_vertically(message1)
-        sign.loop_left(message1)
-        sign.flash(message1, count=3)
-        sign.split_out_vertically(message1)
-        time.sleep(1)
+        sign.join_in_vertically(scroll_out_message)
+        sign.loop_left(scroll_out_message)
+        sign.flash(scroll_out_message, count=3)
+        sign.split_out_vertically(scroll_out_message)
+        sign.dwell(1)
         sign.set_background_color((0, 255, 0))
         sign.fade_in(message2)
-        time.sleep(1)
+        sign.dwell(1)
         sign.fade_out(message2)
         sign.scroll_in_from_top(message3)
-        time.sleep(1)
+        sign.dwell(1)
         sign.scroll_out_to_bottom(message3)
         sign.scroll_in_from_right(message4)
-        time.sleep(1)
+        sign.dwell(1)
 
 
 # Main function
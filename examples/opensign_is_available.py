@@ -1,6 +1,5 @@
 #!/usr/bin/env python
-import time
-from opensign import OpenSign
+from _sign import get_sign
 from opensign.canvas import OpenSignCanvas
 
 
@@ -11,14 +10,14 @@ def main():
     message.add_text("OpenSign is now available", color=(255, 255, 0))
     message.set_shadow()
 
-    sign = OpenSign(chain=6)
+    sign = get_sign(chain=6)
     sign.set_background_image("background.jpg")
 
     while True:
         sign.scroll_in_from_top(message)
-        time.sleep(1)
+        sign.dwell(1)
         sign.scroll_out_to_bottom(message)
-        time.sleep(1)
+        sign.dwell(1)
 
 
 # Main function
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""Run any of the examples by name, e.g. ``python runner.py stroked_text``."""
+import argparse
+import importlib
+import os
+
+DEMOS = sorted(
+    name[:-3]
+    for name in os.listdir(os.path.dirname(os.path.abspath(__file__)))
+    if name.endswith(".py") and not name.startswith("_") and name != "runner.py"
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run one of the OpenSign examples.")
+    parser.add_argument("demo", choices=DEMOS, help="The name of the example to run.")
+    args = parser.parse_args(argv)
+    importlib.import_module(args.demo).main()
+
+
+# Main function
+if __name__ == "__main__":
+    main()
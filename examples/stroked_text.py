@@ -1,6 +1,5 @@
 #!/usr/bin/env python
-import time
-from opensign import OpenSign
+from _sign import get_sign
 from opensign.canvas import OpenSignCanvas
 
 
@@ -10,12 +9,12 @@ def main():
     message.set_stroke(1, (255, 255, 255))
     message.add_text("Hello World!", color=(0, 255, 0))
 
-    sign = OpenSign(chain=6)
+    sign = get_sign(chain=6)
     while True:
         sign.scroll_in_from_left(message)
-        time.sleep(1)
+        sign.dwell(1)
         sign.scroll_out_to_right(message)
-        time.sleep(1)
+        sign.dwell(1)
 
 
 # Main function
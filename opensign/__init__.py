@@ -37,21 +37,78 @@ Implementation Notes
 
 * Python Imaging Library (Pillow)
 
+* Pillow-SIMD may be installed in place of Pillow for faster compositing on x86:
+  https://github.com/uploadcare/pillow-simd
+
 """
 
+import collections
+import functools
+import itertools
 import time
 import os
-from PIL import Image, ImageChops
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
 from rgbmatrix import RGBMatrix, RGBMatrixOptions
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/makermelissa/OpenSign.git"
 
+# Fill color used to clear parts of an RGBA image
+_TRANSPARENT = (0, 0, 0, 0)
+
+# How many frames of an animation are composited ahead of the one being shown
+_FRAMES_AHEAD = 3
+
+
+@functools.lru_cache(maxsize=256)
+def _clamp_table(level):
+    """Lookup table for Image.point that caps 8-bit values at level."""
+    return tuple(min(value, level) for value in range(256))
+
+
+def _bake(image, opacity_level, shadow_level, shadow_offset):
+    """Combine an RGBA image with its shadow and cap its alpha at the opacity level, so it
+    can be blended onto a frame in a single paste. Returns the image and mask to paste
+    along with their position relative to the original, which only moves if the shadow
+    is up and to the left. Without a shadow, the image is used as it is with a capped mask."""
+    alpha = image.getchannel("A")
+    if opacity_level != 255:
+        alpha = alpha.point(_clamp_table(opacity_level))
+    if not shadow_level:
+        return image, alpha, (0, 0)
+    foreground = image
+    if opacity_level != 255:
+        foreground = image.copy()
+        foreground.putalpha(alpha)
+    offset = abs(shadow_offset)
+    baked = Image.new(
+        "RGBA", (image.width + offset, image.height + offset), _TRANSPARENT
+    )
+    # The baked image starts out transparent, so the shadow can be pasted straight in
+    shadow = Image.new("RGBA", image.size, _TRANSPARENT)
+    shadow.putalpha(image.getchannel("A").point(_clamp_table(shadow_level)))
+    baked.paste(shadow, box=(max(shadow_offset, 0),) * 2)
+    baked.alpha_composite(foreground, dest=(max(-shadow_offset, 0),) * 2)
+    return baked, baked, (min(shadow_offset, 0),) * 2
+
 
 # pylint: disable=too-many-public-methods, too-many-lines
 class OpenSign:
     """Main class that controls the sign and graphics effects."""
 
+    __slots__ = (
+        "_matrix",
+        "_buffer",
+        "_width",
+        "_height",
+        "_background",
+        "_frame_images",
+        "_position",
+        "_frame_period",
+        "_renderer",
+    )
+
     # pylint: disable=too-many-locals
     def __init__(
         self,
@@ -72,6 +129,7 @@ class OpenSign:
         row_addr_type=0,
         multiplexing=0,
         pixel_mapper="",
+        max_frame_rate=100,
     ):
         options = RGBMatrixOptions()
 
@@ -98,8 +156,21 @@ class OpenSign:
 
         self._matrix = RGBMatrix(options=options)
         self._buffer = self._matrix.CreateFrameCanvas()
-        self._background = (0, 0, 0)
+        # The display size never changes, so read it from the matrix only once
+        self._width = self._matrix.width
+        self._height = self._matrix.height
+        # The background is kept as a display-sized RGB image that each frame starts from
+        self._background = Image.new("RGB", (self._width, self._height), (0, 0, 0))
+        # Frames are composited into these in turn. There are enough that the ones
+        # composited ahead and the one being shown are never reused too early
+        self._frame_images = itertools.cycle(
+            [Image.new("RGB", self._background.size) for _ in range(_FRAMES_AHEAD + 2)]
+        )
         self._position = (0, 0)
+        # Scrolls never try to show frames faster than this
+        self._frame_period = 1 / max_frame_rate
+        # Frames are composited on this thread while the previous one is displayed
+        self._renderer = ThreadPoolExecutor(max_workers=1)
         # pylint: enable=too-many-locals
 
     def _update(self):
@@ -108,82 +179,61 @@ class OpenSign:
     @property
     def width(self):
         """Returns the width in pixels"""
-        return self._matrix.width
+        return self._width
 
     @property
     def height(self):
         """Returns the height in pixels"""
-        return self._matrix.height
+        return self._height
 
     # pylint: disable=too-many-arguments, too-many-locals
     def _add_background(
-        self, image, x, y, opacity=1.0, shadow_intensity=0, shadow_offset=1
+        self,
+        image,
+        x,
+        y,
+        opacity=1.0,
+        shadow_intensity=0,
+        shadow_offset=1,
+        baked=None,
     ):
-        """Combine the foreground and background images and apply any shadow and opacity effects."""
-        if isinstance(self._background, tuple):
-            combined_image = Image.new(
-                "RGBA", (self._matrix.width, self._matrix.height), self._background
-            )
-        else:
-            combined_image = Image.new(
-                "RGBA", (self._matrix.width, self._matrix.height)
-            )
-            combined_image.alpha_composite(Image.open(self._background).convert("RGBA"))
+        """Combine the foreground and background images and apply any shadow and opacity effects.
+        The foreground is blended straight onto the background in a single paste, using its
+        alpha as the mask, and anything that falls outside of the display is clipped away.
 
-        source_x = source_y = 0
-        if x < 0:
-            source_x = 0 - x
-            x = 0
-        if y < 0:
-            source_y = 0 - y
-            y = 0
+        The shadow and opacity are first baked into a copy of the whole foreground, so an
+        animation of one image can pass the same baked dict for every frame and each level
+        is only baked once.
+        """
+        width, height = self._width, self._height
+        # The frame is RGB throughout so the result can be handed to SetImage as it is
+        combined_image = next(self._frame_images)
+        combined_image.paste(self._background)
 
-        # Keep opacity in the range of 0-1.0
+        # Keep opacity in the range of 0-1.0 and work with whole 0-255 alpha levels
         opacity = max(0, min(1.0, opacity))
+        opacity_level = round(opacity * 255)
+        shadow_level = round(shadow_intensity * opacity * 255)
+
+        if not opacity_level:
+            return combined_image
+        mask = image
+        if opacity_level != 255 or shadow_level:
+            # The shadow and opacity are baked into the foreground once for each level
+            if baked is None:
+                baked = {}
+            if (opacity_level, shadow_level) not in baked:
+                baked[opacity_level, shadow_level] = _bake(
+                    image, opacity_level, shadow_level, shadow_offset
+                )
+            image, mask, (offset_x, offset_y) = baked[opacity_level, shadow_level]
+            x += offset_x
+            y += offset_y
 
-        foreground_image = Image.new(
-            "RGBA", (self._matrix.width, self._matrix.height), (0, 0, 0, 0)
-        )
-        if source_x < image.width and source_y < image.height:
-            foreground_image.alpha_composite(
-                image, dest=(x, y), source=(source_x, source_y)
-            )
-
-        alpha = foreground_image.split()[-1]
-
-        if opacity == 1:
-            opacity_mask = ImageChops.invert(alpha)
-        elif opacity == 0:
-            opacity_mask = Image.new(
-                "L", (self._matrix.width, self._matrix.height), 255
-            )
-        else:
-            opacity_filter = Image.new(
-                "L", (self._matrix.width, self._matrix.height), round(opacity * 255)
-            )
-            opacity_mask = ImageChops.darker(alpha, opacity_filter)
-            opacity_mask = ImageChops.invert(opacity_mask)
-
-        if shadow_intensity:
-            shadow_image = Image.new("RGB", (self._matrix.width, self._matrix.height))
-            shadow_filter = Image.new(
-                "L",
-                (self._matrix.width, self._matrix.height),
-                round(shadow_intensity * opacity * 255),
-            )
-            shadow_mask = ImageChops.darker(alpha, shadow_filter)
-            shadow_shifted = Image.new(
-                "L", (self._matrix.width, self._matrix.height), 0
-            )
-            shadow_shifted.paste(shadow_mask, box=(shadow_offset, shadow_offset))
-            shadow_shifted = ImageChops.invert(shadow_shifted)
-            combined_image = Image.composite(
-                combined_image, shadow_image, shadow_shifted
-            )
-
-        return Image.composite(combined_image, foreground_image, opacity_mask).convert(
-            "RGB"
-        )
+        # Skip the foreground if none of it is visible on the display
+        if x < width and y < height and x + image.width > 0 and y + image.height > 0:
+            combined_image.paste(image, box=(x, y), mask=mask)
+        return combined_image
 
     # pylint: enable=too-many-arguments, too-many-locals
 
@@ -207,42 +257,94 @@ class OpenSign:
         self._update()
 
     # pylint: disable=too-many-arguments
-    def _draw_image(self, image, x, y, opacity, shadow_intensity, shadow_offset):
-        """Draws an image to the buffer. Settings are passed as additional parameters.
-        It also sets the current position and performs a swap.
-        """
-        self._position = (x, y)
-        self._buffer.SetImage(
-            self._add_background(
-                image,
-                x,
-                y,
-                opacity=opacity,
-                shadow_intensity=shadow_intensity,
-                shadow_offset=shadow_offset,
-            ),
-            0,
-            0,
+    def _render(self, frames, shadow_intensity, shadow_offset, baked=None, memo=None):
+        """Composite the next frame of an animation. Returns the position it was drawn at
+        along with the finished image and its raw data, or None once there are no frames
+        left. If a baked dict is given, the frames are known to share one unchanging image,
+        so its baked shadow and opacity are kept in it. If a memo dict is given too, finished
+        frames are kept in it by position and opacity and reused."""
+        frame = next(frames, None)
+        if frame is None:
+            return None
+        image, x, y, opacity = frame
+        if memo is not None and (x, y, opacity) in memo:
+            return ((x, y),) + memo[x, y, opacity]
+        image = self._add_background(
+            image, x, y, opacity, shadow_intensity, shadow_offset, baked
         )
-        self._update()
+        if memo is None:
+            return (x, y), image, image.tobytes()
+        # Frame images are reused, so the memo needs its own copy
+        memo[x, y, opacity] = (image.copy(), image.tobytes())
+        return ((x, y),) + memo[x, y, opacity]
 
     # pylint: enable=too-many-arguments
 
+    def _animate(self, canvas, frames, delay, repeats=False, static=True):
+        """Show a sequence of frames with a delay between each one. Frames are given
+        as (image, x, y, opacity) and use the canvas shadow settings. While a frame is
+        being shown, the next few are composited on a worker thread so that work overlaps
+        the swap and the wait rather than adding to them, and an occasional slow frame
+        doesn't hold up the display. A frame that is identical to the one already on the
+        display is not sent again, and frames that would be shown late are skipped.
+
+        Animations that show the same unchanging image over and over, such as blinking,
+        set repeats so that each distinct frame is only composited once. Animations that
+        change their image between frames clear static so it is baked afresh.
+        """
+        args = (
+            iter(frames),
+            canvas.shadow_intensity,
+            canvas.shadow_offset,
+            {} if static else None,
+            {} if repeats else None,
+        )
+        submit = functools.partial(self._renderer.submit, self._render, *args)
+        pending = collections.deque(submit() for _ in range(_FRAMES_AHEAD))
+        shown = None
+        # Each frame is due a delay after the one before it was due rather than after it
+        # was shown, so the time taken to show a frame doesn't add up over the animation
+        deadline = time.perf_counter()
+        while True:
+            frame = pending.popleft().result()
+            if frame is None:
+                return
+            pending.append(submit())
+            # If the next frame is already due, this one is dropped so that a slow display
+            # catches up instead of stretching the animation. The last frame is always shown
+            while time.perf_counter() > deadline + delay:
+                if pending[0].result() is None:
+                    break
+                frame = pending.popleft().result()
+                pending.append(submit())
+                deadline += delay
+            self._position, image, data = frame
+            # Fades in particular produce runs of identical frames, which don't need sending
+            if data != shown:
+                shown = data
+                self._buffer.SetImage(image, 0, 0)
+                self._update()
+            deadline += delay
+            self._wait(deadline)
+
     # pylint: disable=no-self-use
     def _create_loop_image(self, image, x_offset, y_offset):
-        """Attach a copy of an image by a certain offset so it can be looped."""
+        """Attach a copy of an image by a certain offset so it can be looped.
+
+        The offset is never smaller than the image, so the two copies do not
+        overlap and can be pasted straight onto the transparent image."""
         loop_image = Image.new(
-            "RGBA", (image.width + x_offset, image.height + y_offset), (0, 0, 0, 0)
+            "RGBA", (image.width + x_offset, image.height + y_offset), _TRANSPARENT
         )
-        loop_image.alpha_composite(image, dest=(0, 0))
-        loop_image.alpha_composite(image, dest=(x_offset, y_offset))
+        loop_image.paste(image, box=(0, 0))
+        loop_image.paste(image, box=(x_offset, y_offset))
         return loop_image
 
     # pylint: enable=no-self-use
 
     def _get_centered_position(self, canvas):
-        return int(self._matrix.width / 2 - canvas.width / 2), int(
-            self._matrix.height / 2 - canvas.height / 2
+        return int(self._width / 2 - canvas.width / 2), int(
+            self._height / 2 - canvas.height / 2
         )
 
     def set_background_color(self, color):
@@ -253,34 +355,66 @@ class OpenSign:
         :type color: tuple or list or int
         """
         if isinstance(color, (tuple, list)) and len(color) == 3:
-            self._background = tuple(color)
+            color = tuple(color)
         elif isinstance(color, int):
-            self._background = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+            color = tuple((color & 0xFFFFFF).to_bytes(3, "big"))
         else:
             raise ValueError("Color should be an integer or 3 value tuple or list.")
+        self._background = Image.new("RGB", (self._width, self._height), color)
 
     def set_background_image(self, file):
-        """Sets the background to an image
+        """Sets the background to an image. The image is decoded once when it is set
+        rather than on every frame, so an already opened image may also be passed in.
 
-        :param string file: The file location of the image to display.
+        :param file: The file location of the image to display or an opened image.
+        :type file: string or PIL.Image.Image
         """
-        if os.path.exists(file):
-            self._background = file
+        if isinstance(file, Image.Image):
+            image = file.convert("RGBA")
+        elif os.path.exists(file):
+            with Image.open(file) as opened_image:
+                image = opened_image.convert("RGBA")
         else:
             raise ValueError(f"Specified background file {file} was not found")
+        background = Image.new("RGBA", (self._width, self._height))
+        background.alpha_composite(image)
+        # The display has no use for transparency, so it is dropped once here
+        self._background = background.convert("RGB")
 
     @staticmethod
-    def _wait(start_time, duration):
-        """Uses time.monotonic() to wait from the start time for a specified duration"""
-        while time.monotonic() < (start_time + duration):
-            pass
-        return time.monotonic()
+    def _wait(deadline):
+        """Uses time.perf_counter() to wait until a deadline. Most of the wait is spent
+        sleeping so the CPU is free for the matrix driver and only the last millisecond
+        is spun to make up for the sleep's imprecision. The spin yields on each pass so
+        the thread compositing the next frame can run."""
+        remaining = deadline - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        while time.perf_counter() < deadline:
+            time.sleep(0)
+
+    # pylint: disable=no-self-use
+    def dwell(self, duration=1):
+        """Hold the current frame on the display for a certain period of time. This
+        sleeps rather than busy waiting, so the CPU is left free for the matrix driver.
+
+        :param float duration: (optional) The period of time to hold the frame
+                               in seconds. (default=1)
+        """
+        deadline = time.perf_counter() + duration
+        remaining = duration
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = deadline - time.perf_counter()
+
+    # pylint: enable=no-self-use
 
     # pylint: disable=too-many-arguments
     def scroll_from_to(self, canvas, duration, start_x, start_y, end_x, end_y):
         """
         Scroll the canvas from one position to another over a certain period of
-        time.
+        time. The canvas moves by a pixel at a time, or by more when moving that slowly
+        would take more frames than the maximum frame rate allows.
 
         :param canvas: The canvas to animate.
         :param float duration: The period of time to perform the animation over in seconds.
@@ -290,18 +424,26 @@ class OpenSign:
         :param int end_y: The Ending Y Position
         :type canvas: OpenSignCanvas
         """
-        steps = max(abs(end_x - start_x), abs(end_y - start_y))
-        if not steps:
+        distance = max(abs(end_x - start_x), abs(end_y - start_y))
+        if not distance:
             return
+        # Move a pixel per frame unless that is faster than the frame rate allows,
+        # in which case the canvas moves further each frame
+        steps = min(distance, max(1, int(duration / self._frame_period)))
         increment_x = (end_x - start_x) / steps
         increment_y = (end_y - start_y) / steps
-        for i in range(steps + 1):
-            start_time = time.monotonic()
-            current_x = start_x + round(i * increment_x)
-            current_y = start_y + round(i * increment_y)
-            self._draw(canvas, current_x, current_y)
-            if i <= steps:
-                self._wait(start_time, duration / steps)
+        image = canvas.get_image()
+        opacity = canvas.opacity
+        frames = (
+            (
+                image,
+                start_x + round(i * increment_x),
+                start_y + round(i * increment_y),
+                opacity,
+            )
+            for i in range(steps + 1)
+        )
+        self._animate(canvas, frames, duration / steps)
 
     # pylint: enable=too-many-arguments
 
@@ -332,7 +474,7 @@ class OpenSign:
         """
         center_x, center_y = self._get_centered_position(canvas)
         self.scroll_from_to(
-            canvas, duration, self._matrix.width, center_y, center_x + x, center_y
+            canvas, duration, self._width, center_y, center_x + x, center_y
         )
 
     def scroll_in_from_top(self, canvas, duration=1, y=0):
@@ -362,7 +504,7 @@ class OpenSign:
         """
         center_x, center_y = self._get_centered_position(canvas)
         self.scroll_from_to(
-            canvas, duration, center_x, self._matrix.height, center_x, center_y + y
+            canvas, duration, center_x, self._height, center_x, center_y + y
         )
 
     def scroll_out_to_left(self, canvas, duration=1):
@@ -390,7 +532,7 @@ class OpenSign:
         """
         current_x, current_y = self._position
         self.scroll_from_to(
-            canvas, duration, current_x, current_y, self._matrix.width, current_y
+            canvas, duration, current_x, current_y, self._width, current_y
         )
 
     def scroll_out_to_top(self, canvas, duration=1):
@@ -418,7 +560,7 @@ class OpenSign:
         """
         current_x, current_y = self._position
         self.scroll_from_to(
-            canvas, duration, current_x, current_y, current_x, self._matrix.height
+            canvas, duration, current_x, current_y, current_x, self._height
         )
 
     def set_position(self, canvas, x=0, y=0):
@@ -459,13 +601,10 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        delay = duration / count / 2
-        for _ in range(count):
-            start_time = time.monotonic()
-            self.hide(canvas)
-            start_time = self._wait(start_time, delay)
-            self.show(canvas)
-            self._wait(start_time, delay)
+        frames = self._fade_frames(
+            canvas.get_image(), self._position, (0, round(canvas.opacity * 255)) * count
+        )
+        self._animate(canvas, frames, duration / count / 2, repeats=True)
 
     def flash(self, canvas, count=3, duration=1):
         """Fade the foreground in and out a centain number of
@@ -477,11 +616,37 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        delay = duration / count / 2
         steps = 50 // count
-        for _ in range(count):
-            self.fade_out(canvas, duration=delay, steps=steps)
-            self.fade_in(canvas, duration=delay, steps=steps)
+        fade_in = self._fade_levels(canvas, steps)
+        fade_out = fade_in[::-1]
+        image = canvas.get_image()
+        centered = self._get_centered_position(canvas)
+
+        def frames(position):
+            # Each flash fades out where the canvas is and back in at the center
+            for _ in range(count):
+                yield from self._fade_frames(image, position, fade_out)
+                yield from self._fade_frames(image, centered, fade_in)
+                position = centered
+
+        self._animate(
+            canvas,
+            frames(self._position),
+            duration / count / 2 / (steps + 1),
+            repeats=True,
+        )
+
+    @staticmethod
+    def _fade_levels(canvas, steps):
+        """The alpha level of each step of a fade in, from 0 up to the canvas opacity.
+        A fade out uses the same levels in reverse, so both directions match."""
+        top_level = canvas.opacity * 255
+        return tuple(round(step * top_level / steps) for step in range(steps + 1))
+
+    @staticmethod
+    def _fade_frames(image, position, levels):
+        x, y = position
+        return ((image, x, y, level / 255) for level in levels)
 
     def fade_in(self, canvas, duration=1, steps=50):
         """Fade the foreground in over a certain period of time
@@ -494,13 +659,12 @@ class OpenSign:
         :param float steps: (optional) The number of steps to perform the animation. (default=50)
         :type canvas: OpenSignCanvas
         """
-        current_x = int(self._matrix.width / 2 - canvas.width / 2)
-        current_y = int(self._matrix.height / 2 - canvas.height / 2)
-        delay = duration / (steps + 1)
-        for opacity in range(steps + 1):
-            start_time = time.monotonic()
-            self._draw(canvas, current_x, current_y, opacity=opacity / steps)
-            self._wait(start_time, delay)
+        frames = self._fade_frames(
+            canvas.get_image(),
+            self._get_centered_position(canvas),
+            self._fade_levels(canvas, steps),
+        )
+        self._animate(canvas, frames, duration / (steps + 1))
 
     def fade_out(self, canvas, duration=1, steps=50):
         """Fade the foreground out over a certain period of time
@@ -513,16 +677,10 @@ class OpenSign:
         :param float steps: (optional) The number of steps to perform the animation. (default=50)
         :type canvas: OpenSignCanvas
         """
-        delay = duration / (steps + 1)
-        for opacity in range(steps + 1):
-            start_time = time.monotonic()
-            self._draw(
-                canvas,
-                self._position[0],
-                self._position[1],
-                opacity=(steps - opacity) / steps,
-            )
-            self._wait(start_time, delay)
+        frames = self._fade_frames(
+            canvas.get_image(), self._position, self._fade_levels(canvas, steps)[::-1]
+        )
+        self._animate(canvas, frames, duration / (steps + 1))
 
     def join_in_horizontally(self, canvas, duration=0.5):
         """Show the effect of a split canvas joining horizontally
@@ -533,32 +691,34 @@ class OpenSign:
                                over. (default=0.5)
         :type canvas: OpenSignCanvas
         """
-        current_x = int(self._matrix.width / 2 - canvas.width / 2)
-        current_y = int(self._matrix.height / 2 - canvas.height / 2)
+        current_x, current_y = self._get_centered_position(canvas)
         image = canvas.get_image()
-        left_image = image.crop(box=(0, 0, image.width // 2 + 1, image.height))
-        right_image = image.crop(
-            box=(image.width // 2 + 1, 0, image.width, image.height)
+        half_width = image.width // 2
+        left_image = image.crop(box=(0, 0, half_width + 1, image.height))
+        right_image = image.crop(box=(half_width + 1, 0, image.width, image.height))
+        distance = self._width // 2
+        right_x = self._width + half_width + 1
+        right_end = right_x + right_image.width
+        opacity = canvas.opacity
+        effect_image = Image.new(
+            "RGBA", (self._width + image.width, image.height), _TRANSPARENT
         )
-        distance = self._matrix.width // 2
-        for i in range(distance + 1):
-            start_time = time.monotonic()
-            effect_image = Image.new(
-                "RGBA", (self._matrix.width + image.width, image.height), (0, 0, 0, 0)
-            )
-            effect_image.alpha_composite(left_image, dest=(i, 0))
-            effect_image.alpha_composite(
-                right_image, dest=(self._matrix.width + image.width // 2 - i + 1, 0)
-            )
-            self._draw_image(
-                effect_image,
-                current_x - self._matrix.width // 2,
-                current_y,
-                canvas.opacity,
-                canvas.shadow_intensity,
-                canvas.shadow_offset,
-            )
-            self._wait(start_time, duration / distance)
+
+        def frames():
+            # The halves move a pixel per frame and never overlap, so they are pasted
+            # into the same image and only the column each one left behind is cleared
+            for i in range(distance + 1):
+                if i:
+                    effect_image.paste(_TRANSPARENT, box=(i - 1, 0, i, image.height))
+                    effect_image.paste(
+                        _TRANSPARENT,
+                        box=(right_end - i, 0, right_end - i + 1, image.height),
+                    )
+                effect_image.paste(left_image, box=(i, 0))
+                effect_image.paste(right_image, box=(right_x - i, 0))
+                yield effect_image, current_x - distance, current_y, opacity
+
+        self._animate(canvas, frames(), duration / distance, static=False)
         self._position = (current_x, current_y)
 
     def join_in_vertically(self, canvas, duration=0.5):
@@ -570,32 +730,34 @@ class OpenSign:
                                over. (default=0.5)
         :type canvas: OpenSignCanvas
         """
-        current_x = int(self._matrix.width / 2 - canvas.width / 2)
-        current_y = int(self._matrix.height / 2 - canvas.height / 2)
+        current_x, current_y = self._get_centered_position(canvas)
         image = canvas.get_image()
-        top_image = image.crop(box=(0, 0, image.width, image.height // 2 + 1))
-        bottom_image = image.crop(
-            box=(0, image.height // 2 + 1, image.width, image.height)
+        half_height = image.height // 2
+        top_image = image.crop(box=(0, 0, image.width, half_height + 1))
+        bottom_image = image.crop(box=(0, half_height + 1, image.width, image.height))
+        distance = self._height // 2
+        bottom_y = self._height + half_height + 1
+        bottom_end = bottom_y + bottom_image.height
+        opacity = canvas.opacity
+        effect_image = Image.new(
+            "RGBA", (image.width, self._height + image.height), _TRANSPARENT
         )
-        distance = self._matrix.height // 2
-        for i in range(distance + 1):
-            start_time = time.monotonic()
-            effect_image = Image.new(
-                "RGBA", (image.width, self._matrix.height + image.height), (0, 0, 0, 0)
-            )
-            effect_image.alpha_composite(top_image, dest=(0, i))
-            effect_image.alpha_composite(
-                bottom_image, dest=(0, self._matrix.height + image.height // 2 - i + 1)
-            )
-            self._draw_image(
-                effect_image,
-                current_x,
-                current_y - self._matrix.height // 2,
-                canvas.opacity,
-                canvas.shadow_intensity,
-                canvas.shadow_offset,
-            )
-            self._wait(start_time, duration / distance)
+
+        def frames():
+            # The halves move a pixel per frame and never overlap, so they are pasted
+            # into the same image and only the row each one left behind is cleared
+            for i in range(distance + 1):
+                if i:
+                    effect_image.paste(_TRANSPARENT, box=(0, i - 1, image.width, i))
+                    effect_image.paste(
+                        _TRANSPARENT,
+                        box=(0, bottom_end - i, image.width, bottom_end - i + 1),
+                    )
+                effect_image.paste(top_image, box=(0, i))
+                effect_image.paste(bottom_image, box=(0, bottom_y - i))
+                yield effect_image, current_x, current_y - distance, opacity
+
+        self._animate(canvas, frames(), duration / distance, static=False)
         self._position = (current_x, current_y)
 
     def split_out_horizontally(self, canvas, duration=0.5):
@@ -609,30 +771,35 @@ class OpenSign:
         """
         current_x, current_y = self._position
         image = canvas.get_image()
-        left_image = image.crop(box=(0, 0, image.width // 2 + 1, image.height))
-        right_image = image.crop(
-            box=(image.width // 2 + 1, 0, image.width, image.height)
+        half_width = image.width // 2
+        left_image = image.crop(box=(0, 0, half_width + 1, image.height))
+        right_image = image.crop(box=(half_width + 1, 0, image.width, image.height))
+        distance = self._width // 2
+        right_x = distance + half_width + 1
+        left_end = distance + left_image.width
+        opacity = canvas.opacity
+        effect_image = Image.new(
+            "RGBA", (self._width + image.width, image.height), _TRANSPARENT
         )
-        distance = self._matrix.width // 2
-        for i in range(distance + 1):
-            start_time = time.monotonic()
-            effect_image = Image.new(
-                "RGBA", (self._matrix.width + image.width, image.height), (0, 0, 0, 0)
-            )
-            effect_image.alpha_composite(left_image, dest=(distance - i, 0))
-            effect_image.alpha_composite(
-                right_image, dest=(distance + image.width // 2 + i + 1, 0)
-            )
-            self._draw_image(
-                effect_image,
-                current_x - self._matrix.width // 2,
-                current_y,
-                canvas.opacity,
-                canvas.shadow_intensity,
-                canvas.shadow_offset,
-            )
-            self._wait(start_time, duration / distance)
-        self._position = (current_x - self._matrix.width // 2, current_y)
+
+        def frames():
+            # The halves move a pixel per frame and never overlap, so they are pasted
+            # into the same image and only the column each one left behind is cleared
+            for i in range(distance + 1):
+                if i:
+                    effect_image.paste(
+                        _TRANSPARENT,
+                        box=(left_end - i, 0, left_end - i + 1, image.height),
+                    )
+                    effect_image.paste(
+                        _TRANSPARENT,
+                        box=(right_x + i - 1, 0, right_x + i, image.height),
+                    )
+                effect_image.paste(left_image, box=(distance - i, 0))
+                effect_image.paste(right_image, box=(right_x + i, 0))
+                yield effect_image, current_x - distance, current_y, opacity
+
+        self._animate(canvas, frames(), duration / distance, static=False)
 
     def split_out_vertically(self, canvas, duration=0.5):
         """Show the effect of a canvas splitting vertically
@@ -645,28 +812,68 @@ class OpenSign:
         """
         current_x, current_y = self._position
         image = canvas.get_image()
-        top_image = image.crop(box=(0, 0, image.width, image.height // 2))
-        bottom_image = image.crop(box=(0, image.height // 2, image.width, image.height))
-        distance = self._matrix.height // 2
-        for i in range(distance + 1):
-            start_time = time.monotonic()
-            effect_image = Image.new(
-                "RGBA", (image.width, self._matrix.height + image.height), (0, 0, 0, 0)
-            )
-            effect_image.alpha_composite(top_image, dest=(0, distance - i))
-            effect_image.alpha_composite(
-                bottom_image, dest=(0, distance + image.height // 2 + i + 1)
-            )
-            self._draw_image(
-                effect_image,
-                current_x,
-                current_y - self._matrix.height // 2,
-                canvas.opacity,
-                canvas.shadow_intensity,
-                canvas.shadow_offset,
-            )
-            self._wait(start_time, duration / distance)
-        self._position = (current_x, current_y - self._matrix.height // 2)
+        half_height = image.height // 2
+        top_image = image.crop(box=(0, 0, image.width, half_height))
+        bottom_image = image.crop(box=(0, half_height, image.width, image.height))
+        distance = self._height // 2
+        bottom_y = distance + half_height + 1
+        top_end = distance + top_image.height
+        opacity = canvas.opacity
+        effect_image = Image.new(
+            "RGBA", (image.width, self._height + image.height), _TRANSPARENT
+        )
+
+        def frames():
+            # The halves move a pixel per frame and never overlap, so they are pasted
+            # into the same image and only the row each one left behind is cleared
+            for i in range(distance + 1):
+                if i:
+                    effect_image.paste(
+                        _TRANSPARENT, box=(0, top_end - i, image.width, top_end - i + 1)
+                    )
+                    effect_image.paste(
+                        _TRANSPARENT,
+                        box=(0, bottom_y + i - 1, image.width, bottom_y + i),
+                    )
+                effect_image.paste(top_image, box=(0, distance - i))
+                effect_image.paste(bottom_image, box=(0, bottom_y + i))
+                yield effect_image, current_x, current_y - distance, opacity
+
+        self._animate(canvas, frames(), duration / distance, static=False)
+
+    def _loop(self, canvas, duration, count, x_step, y_step):
+        """Loop a canvas a pixel at a time in the direction of the steps, which are 1 or -1
+        along one axis and 0 along the other. The canvas is attached to a copy of itself
+        one distance further along, so it re-enters from the opposite side."""
+        current_x, current_y = self._position
+        if x_step:
+            distance = max(canvas.width, self._width)
+            loop_image = self._create_loop_image(canvas.get_image(), distance, 0)
+        else:
+            distance = max(canvas.height, self._height)
+            loop_image = self._create_loop_image(canvas.get_image(), 0, distance)
+        # Positions wrap around by the distance, so every pass goes through the same ones.
+        # They are kept in a range that leaves the loop image covering the whole display
+        if x_step:
+            lowest = 0 - canvas.width if x_step < 0 else 1 - distance
+            positions = [
+                ((current_x + x_step * i - lowest) % distance + lowest, current_y)
+                for i in range(1, distance + 1)
+            ]
+        else:
+            lowest = 0 - canvas.height if y_step < 0 else 1 - distance
+            positions = [
+                (current_x, (current_y + y_step * i - lowest) % distance + lowest)
+                for i in range(1, distance + 1)
+            ]
+        opacity = canvas.opacity
+
+        self._animate(
+            canvas,
+            ((loop_image, x, y, opacity) for _ in range(count) for x, y in positions),
+            duration / distance / count,
+            repeats=count > 1,
+        )
 
     def loop_left(self, canvas, duration=1, count=1):
         """Loop a canvas towards the left side of the display over a certain period of time by a
@@ -679,24 +886,7 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        current_x, current_y = self._position
-        distance = max(canvas.width, self._matrix.width)
-        loop_image = self._create_loop_image(canvas.get_image(), distance, 0)
-        for _ in range(count):
-            for _ in range(distance):
-                start_time = time.monotonic()
-                current_x -= 1
-                if current_x < 0 - canvas.width:
-                    current_x += distance
-                self._draw_image(
-                    loop_image,
-                    current_x,
-                    current_y,
-                    canvas.opacity,
-                    canvas.shadow_intensity,
-                    canvas.shadow_offset,
-                )
-                self._wait(start_time, duration / distance / count)
+        self._loop(canvas, duration, count, -1, 0)
 
     def loop_right(self, canvas, duration=1, count=1):
         """Loop a canvas towards the right side of the display over a certain period of time by a
@@ -709,24 +899,7 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        current_x, current_y = self._position
-        distance = max(canvas.width, self._matrix.width)
-        loop_image = self._create_loop_image(canvas.get_image(), distance, 0)
-        for _ in range(count):
-            for _ in range(distance):
-                start_time = time.monotonic()
-                current_x += 1
-                if current_x > 0:
-                    current_x -= distance
-                self._draw_image(
-                    loop_image,
-                    current_x,
-                    current_y,
-                    canvas.opacity,
-                    canvas.shadow_intensity,
-                    canvas.shadow_offset,
-                )
-                self._wait(start_time, duration / distance / count)
+        self._loop(canvas, duration, count, 1, 0)
 
     def loop_up(self, canvas, duration=0.5, count=1):
         """Loop a canvas towards the top side of the display over a certain period of time by a
@@ -739,24 +912,7 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        current_x, current_y = self._position
-        distance = max(canvas.height, self._matrix.height)
-        loop_image = self._create_loop_image(canvas.get_image(), 0, distance)
-        for _ in range(count):
-            for _ in range(distance):
-                start_time = time.monotonic()
-                current_y -= 1
-                if current_y < 0 - canvas.height:
-                    current_y += distance
-                self._draw_image(
-                    loop_image,
-                    current_x,
-                    current_y,
-                    canvas.opacity,
-                    canvas.shadow_intensity,
-                    canvas.shadow_offset,
-                )
-                self._wait(start_time, duration / distance / count)
+        self._loop(canvas, duration, count, 0, -1)
 
     def loop_down(self, canvas, duration=0.5, count=1):
         """Loop a canvas towards the bottom side of the display over a certain period of time by a
@@ -769,21 +925,4 @@ class OpenSign:
                                over. (default=1)
         :type canvas: OpenSignCanvas
         """
-        current_x, current_y = self._position
-        distance = max(canvas.height, self._matrix.height)
-        loop_image = self._create_loop_image(canvas.get_image(), 0, distance)
-        for _ in range(count):
-            for _ in range(distance):
-                start_time = time.monotonic()
-                current_y += 1
-                if current_y > 0:
-                    current_y -= distance
-                self._draw_image(
-                    loop_image,
-                    current_x,
-                    current_y,
-                    canvas.opacity,
-                    canvas.shadow_intensity,
-                    canvas.shadow_offset,
-                )
-                self._wait(start_time, duration / distance / count)
+        self._loop(canvas, duration, count, 0, 1)
@@ -39,24 +39,126 @@ Implementation Notes
 
 """
 
+import functools
+import os
 from PIL import Image, ImageDraw, ImageFont
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/makermelissa/OpenSign.git"
 
+# Image modes without an alpha channel
+_OPAQUE_MODES = ("1", "L", "RGB", "CMYK", "YCbCr")
 
+# Loaded fonts are shared between all canvases, keyed by (file, size)
+_FONT_CACHE = {}
+
+
+def _load_font(file, size=None):
+    """Load a font or return the already loaded copy of it."""
+    key = (file, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        if size is not None:
+            font = ImageFont.truetype(file, size)
+        else:
+            font = ImageFont.load(file)
+        _FONT_CACHE[key] = font
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _load_default_font():
+    """Load Pillow's built-in font, which is used when no font has been added."""
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_image(file, mtime):  # pylint: disable=unused-argument
+    """Decode an image file to RGBA. The modification time is part of the cache
+    key so a file that changes on disk is decoded again."""
+    with Image.open(file) as image:
+        return _prepare_image(image)
+
+
+def _prepare_image(image):
+    """Convert an image to RGBA the way it looks once composited onto an empty canvas,
+    which clears the color of fully transparent pixels. It can then be pasted straight
+    onto an empty area of a canvas."""
+    if image.mode in _OPAQUE_MODES and "transparency" not in image.info:
+        # Every pixel ends up fully opaque, so there is nothing to clear
+        return image.convert("RGBA")
+    prepared_image = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    prepared_image.alpha_composite(image.convert("RGBA"))
+    return prepared_image
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color(color):
+    """Convert an integer or 3 or 4 value tuple to an RGBA tuple."""
+    if isinstance(color, tuple):
+        if len(color) == 3:
+            return (color[0], color[1], color[2], 255)
+        if len(color) == 4:
+            return color
+    if isinstance(color, int):
+        return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF, 255)
+    raise ValueError("Color should be an integer or 3 or 4 value tuple or list.")
+
+
+@functools.lru_cache(maxsize=256)
+def _text_size(text, font, stroke_width):
+    """Measure a line of text. Laying out the text is the slow part of measuring it,
+    so sizes are cached rather than added up from individual glyph advances, which
+    would miss kerning."""
+    return font.getsize(text, stroke_width=stroke_width)
+
+
+# pylint: disable=too-many-arguments
+@functools.lru_cache(maxsize=64)
+def _render_text(text, font, color, stroke_width, stroke_color):
+    """Draw a line of text onto its own transparent image. Returns the image along
+    with the offset of its top left corner from the position the text is drawn at."""
+    left, top, right, bottom = font.getbbox(text, stroke_width=stroke_width)
+    image = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(image).text(
+        (-left, -top),
+        text,
+        font=font,
+        fill=color,
+        stroke_width=stroke_width,
+        stroke_fill=stroke_color,
+    )
+    return image, (left, top)
+
+
+# pylint: enable=too-many-arguments
+
+
+# pylint: disable=too-many-instance-attributes
 class OpenSignCanvas:
     """The Canvas is an empty image that you add text and graphics to. It will automatically
     expand as you add content. You can then display the canvas on the sign and use the animation
-    functions to convey it."""
+    functions to convey it.
+
+    :param reserve: (optional) A (width, height) to set aside room for up front, so that
+                    content up to that size can be added without enlarging the canvas
+                    storage. The canvas itself still starts out empty. (default=None)
+    :type reserve: tuple or list
+    """
 
-    def __init__(self):
+    def __init__(self, reserve=None):
         self._fonts = {}
         self._current_font = None
         self._current_color = (255, 0, 0, 255)
-        self._image = Image.new("RGBA", (0, 0), (0, 0, 0, 0))
-        self._draw = ImageDraw.Draw(self._image)
-        self._cursor = [0, 0]
+        self._reserve = tuple(reserve) if reserve is not None else (0, 0)
+        self._image = Image.new("RGBA", self._reserve, (0, 0, 0, 0))
+        # Drawing context for the current image, created when it is first needed
+        self._draw = None
+        # The image may be larger than the canvas to leave room to grow
+        self._size = (0, 0)
+        # What get_image returns, kept until the canvas changes
+        self._content = None
+        self._cursor_x = self._cursor_y = 0
         self._stroke_width = 0
         self._stroke_color = None
         self._shadow_intensity = 0
@@ -73,11 +175,11 @@ class OpenSignCanvas:
                            Set to None for bitmap fonts. (default=None)
         :param bool use: (optional) Whether or not the font should immediately be used.
                          (default=False)
+
+        Fonts are cached, so adding the same file and size to several canvases
+        only loads it from disk once.
         """
-        if size is not None:
-            self._fonts[name] = ImageFont.truetype(file, size)
-        else:
-            self._fonts[name] = ImageFont.load(file)
+        self._fonts[name] = _load_font(file, size)
         if use or self._current_font is None:
             self._current_font = self._fonts[name]
 
@@ -107,30 +209,42 @@ class OpenSignCanvas:
 
     # pylint: disable=no-self-use
     def _convert_color(self, color):
-        if isinstance(color, (tuple, list)):
-            if len(color) == 3:
-                return (color[0], color[1], color[2], 255)
-            if len(color) == 4:
-                return tuple(color)
-        if isinstance(color, int):
-            return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF, 255)
-        raise ValueError("Color should be an integer or 3 or 4 value tuple or list.")
+        if isinstance(color, tuple) and len(color) == 4:
+            # Already in the form that is stored
+            return color
+        if isinstance(color, list):
+            color = tuple(color)
+        return _parse_color(color)
 
     # pylint: enable=no-self-use
 
     def _enlarge_canvas(self, width, height):
-        if self._cursor[0] + width >= self._image.width:
-            new_width = self._cursor[0] + width
-        else:
-            new_width = self._image.width
-        if self._cursor[1] + height >= self._image.height:
-            new_height = self._cursor[1] + height
+        old_width, old_height = self._size
+        new_width = max(old_width, self._cursor_x + width)
+        new_height = max(old_height, self._cursor_y + height)
+        if new_width == old_width and new_height == old_height:
+            return
+        if new_width > self._image.width or new_height > self._image.height:
+            # Grow the storage at least twofold so that adding content piece by piece
+            # doesn't copy everything that is already on the canvas every time
+            capacity = (
+                new_width
+                if new_width <= self._image.width
+                else max(new_width, self._image.width * 2),
+                new_height
+                if new_height <= self._image.height
+                else max(new_height, self._image.height * 2),
+            )
+            new_image = Image.new("RGBA", capacity, (0, 0, 0, 0))
+            new_image.paste(self._image.crop((0, 0, old_width, old_height)))
+            self._image = new_image
+            self._draw = None
         else:
-            new_height = self._image.height
-        new_image = Image.new("RGBA", (new_width, new_height))
-        new_image.alpha_composite(self._image)
-        self._image = new_image
-        self._draw = ImageDraw.Draw(self._image)
+            # Anything drawn past the old edges would have been cut off, so clear
+            # the area that is now becoming part of the canvas
+            self._image.paste((0, 0, 0, 0), box=(old_width, 0, new_width, new_height))
+            self._image.paste((0, 0, 0, 0), box=(0, old_height, old_width, new_height))
+        self._size = (new_width, new_height)
 
     def set_color(self, color):
         """Set the current text color.
@@ -183,8 +297,9 @@ class OpenSignCanvas:
         else:
             font = self._current_font
         if font is None:
-            font = ImageFont.load_default()
-        x, y = self._cursor
+            font = _load_default_font()
+        x, y = self._cursor_x, self._cursor_y
+        self._content = None
 
         if color is None:
             color = self._current_color
@@ -201,55 +316,131 @@ class OpenSignCanvas:
 
         lines = text.split("\n")
         for index, line in enumerate(lines):
-            (text_width, text_height) = font.getsize(line, stroke_width=stroke_width)
+            (text_width, text_height) = _text_size(line, font, stroke_width)
             self._enlarge_canvas(text_width, text_height)
-            # Draw the text
-            self._draw.text(
+            self._draw_text(
                 (x + x_offset, y + y_offset),
                 line,
-                font=font,
-                fill=color,
-                stroke_width=stroke_width,
-                stroke_fill=stroke_color,
+                font,
+                color,
+                stroke_width,
+                stroke_color,
             )
             # Get size and add to cursor
-            self._cursor[0] += text_width
+            self._cursor_x += text_width
             if index < len(lines) - 1:
+                # The next line is drawn starting at the same x, so measure from there
                 y += text_height
-                self._cursor[0] = 0
-                self._cursor[1] += text_height
+                self._cursor_x = x
+                self._cursor_y += text_height
+
+    def _draw_text(self, position, text, font, color, stroke_width, stroke_color):
+        """Draw a line of text. Drawing onto an empty area gives the same result as
+        pasting a rendering of the text, so a cached one is pasted where possible."""
+        if hasattr(font, "getbbox"):
+            image, (left, top) = _render_text(
+                text, font, color, stroke_width, stroke_color
+            )
+            if not image.width or not image.height:
+                return
+            box = (position[0] + left, position[1] + top)
+            if self._is_empty(box + (box[0] + image.width, box[1] + image.height)):
+                self._image.paste(image, box=box)
+                return
+        if self._draw is None:
+            self._draw = ImageDraw.Draw(self._image)
+        self._draw.text(
+            position,
+            text,
+            font=font,
+            fill=color,
+            stroke_width=stroke_width,
+            stroke_fill=stroke_color,
+        )
 
     # pylint: enable=too-many-arguments
 
     def add_image(self, file):
         """Add an image to the canvas.
 
-        :param string file: The filename of the image. This should be the full path.
+        :param file: The filename of the image. This should be the full path.
+                     An open file object may also be given.
+        :type file: string or os.PathLike or file object
+
+        Decoded images are cached, so adding the same file again does not decode it again
+        unless it has changed on disk. File objects are always decoded.
         """
-        x, y = self._cursor
-        new_image = Image.open(file).convert("RGBA")
+        x, y = self._cursor_x, self._cursor_y
+        self._content = None
+        if isinstance(file, (str, os.PathLike)):
+            file = os.fspath(file)
+            new_image = _load_image(file, os.path.getmtime(file))
+        else:
+            with Image.open(file) as image:
+                new_image = _prepare_image(image)
         self._enlarge_canvas(new_image.width, new_image.height)
-        self._image.alpha_composite(new_image, dest=(x, y))
-        self._cursor[0] += new_image.width
+        # Blending only makes a difference where the image is partly transparent
+        # and there is something underneath it
+        if new_image.getextrema()[3][0] == 255 or self._is_empty(
+            (x, y, x + new_image.width, y + new_image.height)
+        ):
+            self._image.paste(new_image, box=(x, y))
+        else:
+            self._image.alpha_composite(new_image, dest=(x, y))
+        self._cursor_x += new_image.width
+
+    def _is_empty(self, box):
+        """Check whether an area of the canvas image is entirely zero, so that
+        anything drawn there can be pasted rather than blended."""
+        area = self._image.crop(box)
+        if not area.width or not area.height:
+            return True
+        return not any(high for _, high in area.getextrema())
+
+    # pylint: disable=protected-access
+    def clone_style(self):
+        """Create a new empty canvas with the same fonts and style settings as this one.
+        This is handy for pre-rendering several messages that share a look."""
+        canvas = OpenSignCanvas()
+        canvas._fonts = dict(self._fonts)
+        canvas._current_font = self._current_font
+        canvas._current_color = self._current_color
+        canvas._stroke_width = self._stroke_width
+        canvas._stroke_color = self._stroke_color
+        canvas._shadow_intensity = self._shadow_intensity
+        canvas._shadow_offset = self._shadow_offset
+        canvas._opacity = self._opacity
+        return canvas
+
+    # pylint: enable=protected-access
 
     def clear(self):
         """Clear the canvas content, but retain all of the style settings"""
-        self._image = Image.new("RGBA", (0, 0), (0, 0, 0, 0))
-        self._cursor = [0, 0]
+        self._image = Image.new("RGBA", self._reserve, (0, 0, 0, 0))
+        self._draw = None
+        self._size = (0, 0)
+        self._content = None
+        self._cursor_x = self._cursor_y = 0
 
     def get_image(self):
-        """Get the canvas content as an image"""
-        return self._image
+        """Get the canvas content as an image. The same image is returned until content
+        is added or the canvas is cleared, so it should not be modified."""
+        if self._content is None:
+            if self._image.size == self._size:
+                self._content = self._image
+            else:
+                self._content = self._image.crop((0, 0) + self._size)
+        return self._content
 
     @property
     def width(self):
         """Get the current canvas width in pixels"""
-        return self._image.width
+        return self._size[0]
 
     @property
     def height(self):
         """Get the current canvas height in pixels"""
-        return self._image.height
+        return self._size[1]
 
     @property
     def shadow_offset(self):
@@ -293,11 +484,11 @@ class OpenSignCanvas:
     def cursor(self):
         """Get or set the current cursor position in pixels with the top left
         being (0, 0)."""
-        return self._cursor
+        return (self._cursor_x, self._cursor_y)
 
     @cursor.setter
     def cursor(self, value):
         if isinstance(value, (tuple, list)) and len(value) >= 2:
-            self._cursor = [value[0], value[1]]
+            self._cursor_x, self._cursor_y = value[0], value[1]
         else:
             raise TypeError("Value must be a tuple or list")
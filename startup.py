@@ -1,6 +1,4 @@
 #!/usr/bin/env python
-import time
-import copy
 from opensign import OpenSign
 from opensign.canvas import OpenSignCanvas
 
@@ -15,9 +13,7 @@ and fade out
 
 
 def duplicate(item_to_duplicate):
-    new_canvas = copy.copy(item_to_duplicate)
-    new_canvas.clear()
-    return new_canvas
+    return item_to_duplicate.clone_style()
 
 
 def main():
@@ -41,18 +37,18 @@ def main():
 
     circuit_image = "/home/pi/background.jpg"
     sign = OpenSign(chain=6, gpio_mapping="adafruit-hat-pwm")
+    sign.set_background_image(circuit_image)
 
     while True:
-        sign.set_background_image(circuit_image)
         sign.join_in_vertically(message1)
-        time.sleep(1)
+        sign.dwell(1)
         sign.fade_out(message1)
         sign.join_in_horizontally(message2)
         sign.flash(message2, duration=2)
         sign.split_out_vertically(message2)
-        time.sleep(0.5)
+        sign.dwell(0.5)
         sign.scroll_in_from_left(message3)
-        time.sleep(1)
+        sign.dwell(1)
         sign.scroll_out_to_right(message3)
 
 